@@ -4,30 +4,46 @@
 
 import os
 import sys
-import json
 import argparse
-import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-from core.functions import ValidationAgent, AgentOrchestrator
+from core.functions import ValidationAgent, AgentOrchestrator, _DIMENSIONS
 from core.claude_integration import ClaudeAssessmentAgent
+from core._fastmath import warmup
+from core._json import loads, JSONDecodeError
+from core._logging import configure
+
+try:
+    import ijson
+    _EVIDENCE_ERRORS = (ijson.JSONError, JSONDecodeError)
+except ImportError:
+    ijson = None
+    _EVIDENCE_ERRORS = (JSONDecodeError,)
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("verityai_cli.log"),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger("VerityAI.CLI")
+logger = configure("VerityAI.CLI")
 
 def create_specialized_agent(agent_id: str, specialization: str) -> ValidationAgent:
     """Create a specialized validation agent"""
     return ValidationAgent(agent_id, specialization)
 
+def load_evidence_metadata(evidence_path: str) -> Dict[str, Any]:
+    """Extract just the metadata object from an evidence file
+
+    Only the metadata key is needed here, so when ijson is available the file
+    is parsed incrementally and never fully buffered - evidence files can be
+    arbitrarily large.
+    """
+    if ijson is not None:
+        with open(evidence_path, 'rb') as f:
+            for metadata in ijson.items(f, 'metadata'):
+                return metadata
+        return {}
+    with open(evidence_path, 'r') as f:
+        return loads(f.read()).get("metadata", {})
+
 def run_assessment(system_id: str, evidence_path: str, output_dir: str) -> str:
     """Run a comprehensive assessment on an AI system"""
     # Ensure output directory exists
@@ -39,23 +55,16 @@ def run_assessment(system_id: str, evidence_path: str, output_dir: str) -> str:
         sys.exit(1)
     
     try:
-        with open(evidence_path, 'r') as f:
-            evidence = json.load(f)
-    except json.JSONDecodeError:
+        evidence_metadata = load_evidence_metadata(evidence_path)
+    except _EVIDENCE_ERRORS:
         logger.error(f"Invalid JSON in evidence file: {evidence_path}")
         sys.exit(1)
     
     # Create orchestrator
     orchestrator = AgentOrchestrator()
     
-    # Register specialized agents
-    dimensions = [
-        "transparency", "accountability", "fairness", 
-        "privacy", "safety", "security", 
-        "human_value", "social_impact"
-    ]
-    
-    for dimension in dimensions:
+    # Register specialized agents, one per assessment dimension
+    for dimension in sorted(_DIMENSIONS):
         agent = create_specialized_agent(f"{dimension}_agent", dimension)
         orchestrator.register_agent(agent)
     
@@ -63,23 +72,23 @@ def run_assessment(system_id: str, evidence_path: str, output_dir: str) -> str:
     orchestration_id = orchestrator.create_comprehensive_assessment(system_id, {
         "evidence_path": evidence_path,
         "assessment_date": datetime.now().isoformat(),
-        "evidence_metadata": evidence.get("metadata", {})
+        "evidence_metadata": evidence_metadata
     })
     
     logger.info(f"Created assessment: {orchestration_id}")
     
-    # Generate report
-    report_json = orchestrator.generate_report(orchestration_id, "json")
-    report_md = orchestrator.generate_report(orchestration_id, "markdown")
-    
-    # Save reports
+    # Generate reports, streaming each straight to its output file; the two
+    # formats are independent, so build them in parallel
     json_path = os.path.join(output_dir, f"{orchestration_id}.json")
-    with open(json_path, 'w') as f:
-        f.write(report_json)
-    
     md_path = os.path.join(output_dir, f"{orchestration_id}.md")
-    with open(md_path, 'w') as f:
-        f.write(report_md)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        json_future = executor.submit(
+            orchestrator.write_report, orchestration_id, json_path, "json")
+        md_future = executor.submit(
+            orchestrator.write_report, orchestration_id, md_path, "markdown")
+        json_future.result()
+        md_future.result()
     
     logger.info(f"Assessment completed. Reports saved to {output_dir}")
     
@@ -103,7 +112,10 @@ def main():
     
     # Parse arguments
     args = parser.parse_args()
-    
+
+    # Pay any one-time JIT compilation cost before accepting work
+    warmup()
+
     if args.command == "assess":
         run_assessment(args.system_id, args.evidence, args.output_dir)
     elif args.command == "create-agent":
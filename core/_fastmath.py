@@ -0,0 +1,76 @@
+# /core/_fastmath.py
+# [Version 30-08-2026 15:28:34]
+
+"""Numeric helpers for the score-aggregation hot path.
+
+When numba is installed the mean and rating-band lookups are JIT-compiled
+(with cache=True so the compiled artifact persists across runs); otherwise
+plain-Python implementations are used. Run `python -m core.warmup` to pay
+the one-time compilation cost before accepting jobs.
+"""
+
+import bisect
+
+# Compliance-score rating bands, the single source of truth: a score below
+# a band's cutoff (and at or above the previous one) gets that label, and
+# rate() returns the index of the band a score falls into.
+RATING_BANDS = (
+    (2.0, "Significant Concerns"),
+    (3.0, "Needs Improvement"),
+    (3.5, "Satisfactory"),
+    (4.0, "Good"),
+    (4.5, "Very Good"),
+    (float("inf"), "Excellent"),
+)
+_CUTS = tuple(cut for cut, _ in RATING_BANDS[:-1])
+
+try:
+    import numpy as np
+    from numba import njit
+
+    _CUTS_ARR = np.asarray(_CUTS)
+
+    @njit(cache=True)
+    def _mean(arr):
+        s = 0.0
+        for v in arr:
+            s += v
+        return s / arr.shape[0]
+
+    @njit(cache=True)
+    def _rate(score):
+        # Equivalent to bisect_right over the band cutoffs
+        idx = 0
+        for cut in _CUTS_ARR:
+            if score >= cut:
+                idx += 1
+            else:
+                break
+        return idx
+
+    def aggregate(values) -> float:
+        """Mean of an iterable of scores"""
+        return float(_mean(np.fromiter(values, dtype=np.float64)))
+
+    def rate(score: float) -> int:
+        """Index of the rating band a score falls into"""
+        return int(_rate(score))
+
+    def warmup() -> None:
+        """Trigger JIT compilation of the helpers"""
+        aggregate((1.0, 2.0))
+        rate(3.0)
+
+except ImportError:
+
+    def aggregate(values) -> float:
+        """Mean of an iterable of scores"""
+        values = list(values)
+        return sum(values) / len(values)
+
+    def rate(score: float) -> int:
+        """Index of the rating band a score falls into"""
+        return bisect.bisect_right(_CUTS, score)
+
+    def warmup() -> None:
+        """No-op without numba"""
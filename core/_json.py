@@ -0,0 +1,49 @@
+# /core/_json.py
+# [Version 30-08-2026 15:22:41]
+
+"""JSON serialization adapter for the persistence hot path.
+
+Uses orjson (Rust, SIMD-accelerated) when it is installed and falls back to
+the stdlib json module otherwise, so callers get the fast path for free
+without a hard dependency.
+"""
+
+try:
+    import orjson
+
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def dumps(obj, indent: bool = False) -> str:
+        """Serialize obj to a JSON string (indented when indent=True)"""
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+
+    def loads(data):
+        """Deserialize a JSON string or bytes"""
+        return orjson.loads(data)
+
+    def dump(obj, fp, indent: bool = False) -> None:
+        """Serialize obj directly to an open text file"""
+        fp.write(dumps(obj, indent=indent))
+
+except ImportError:
+    import json
+
+    JSONDecodeError = json.JSONDecodeError
+
+    def dumps(obj, indent: bool = False) -> str:
+        """Serialize obj to a JSON string (indented when indent=True)"""
+        if indent:
+            return json.dumps(obj, indent=2)
+        return json.dumps(obj, separators=(',', ':'))
+
+    def loads(data):
+        """Deserialize a JSON string or bytes"""
+        return json.loads(data)
+
+    def dump(obj, fp, indent: bool = False) -> None:
+        """Serialize obj directly to an open text file, chunk by chunk"""
+        if indent:
+            json.dump(obj, fp, indent=2)
+        else:
+            json.dump(obj, fp, separators=(',', ':'))
@@ -0,0 +1,27 @@
+# /core/_logging.py
+# [Version 30-08-2026 15:26:12]
+
+"""Shared logging setup for all VerityAI modules.
+
+Previously each module called logging.basicConfig with its own log file at
+import time; only the first call took effect, but every call still opened a
+FileHandler. configure() attaches the handlers exactly once.
+"""
+
+import logging
+
+LOG_FILE = "verityai_agent.log"
+
+def configure(name: str) -> logging.Logger:
+    """Attach the shared handlers if none exist yet and return a named logger"""
+    root = logging.getLogger()
+    if not root.handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            handlers=[
+                logging.FileHandler(LOG_FILE),
+                logging.StreamHandler()
+            ]
+        )
+    return logging.getLogger(name)
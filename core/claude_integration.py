@@ -4,22 +4,19 @@
 import os
 import json
 import logging
+import secrets
 from typing import Dict, List, Any, Optional, Union
 
+from ._logging import configure
+
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("verityai_claude.log"),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger("VerityAI.Claude")
+logger = configure("VerityAI.Claude")
 
 class ClaudeAssessmentAgent:
     """Integration with Claude for advanced assessment reasoning"""
-    
+
+    __slots__ = ("api_key", "logger")
+
     def __init__(self, api_key: str = None):
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         if not self.api_key:
@@ -32,7 +29,7 @@ class ClaudeAssessmentAgent:
         
         # In an actual implementation, this would create a Claude project
         # and return the project ID
-        project_id = f"claude_project_{project_name}_{os.urandom(4).hex()}"
+        project_id = f"claude_project_{project_name}_{secrets.token_hex(4)}"
         
         return project_id
     
@@ -53,25 +50,21 @@ class ClaudeAssessmentAgent:
                                    assessment_type: str, 
                                    evidence: Dict[str, Any]) -> str:
         """Construct a detailed assessment prompt for Claude"""
-        # Base prompt structure
-        prompt = [
-            f"# {assessment_type.title()} Assessment",
-            "",
-            "## Assessment Task",
-            f"You are conducting a VerityAI {assessment_type} assessment of an AI system.",
-            "Please analyze the provided evidence and generate a detailed assessment report.",
-            "",
-            "## Evidence",
-        ]
-        
-        # Add evidence sections
+        # Evidence sections
         if "documentation" in evidence:
-            prompt.append("### System Documentation")
-            prompt.append("")
-            prompt.append(evidence["documentation"])
-            prompt.append("")
-        
-        return "\n".join(prompt)
+            doc_section = f"\n### System Documentation\n\n{evidence['documentation']}\n"
+        else:
+            doc_section = ""
+
+        return (
+            f"# {assessment_type.title()} Assessment\n"
+            "\n"
+            "## Assessment Task\n"
+            f"You are conducting a VerityAI {assessment_type} assessment of an AI system.\n"
+            "Please analyze the provided evidence and generate a detailed assessment report.\n"
+            "\n"
+            f"## Evidence{doc_section}"
+        )
     
     def _generate_mock_assessment(self, assessment_type: str) -> Dict[str, Any]:
         """Generate a mock assessment for demonstration purposes"""
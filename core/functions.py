@@ -1,22 +1,21 @@
 # /core/functions.py
 # [Version 26-04-2025 15:18:52]
 
-import json
 import os
 import datetime
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Any, Optional, Union
 
+import io
+
+from ._fastmath import RATING_BANDS, aggregate, rate
+from ._json import dump, dumps, loads
+from ._logging import configure
+
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("verityai_agent.log"),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger("VerityAI")
+logger = configure("VerityAI")
 
 # Base paths
 KNOWLEDGE_BASE_PATH = os.path.join(os.path.dirname(__file__), "../knowledge")
@@ -27,42 +26,84 @@ TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), "../templates")
 for path in [KNOWLEDGE_BASE_PATH, ASSESSMENT_PATH, TEMPLATE_PATH]:
     os.makedirs(path, exist_ok=True)
 
+# Assessment dimensions covered by a comprehensive evaluation
+_DIMENSIONS = frozenset((
+    "transparency", "accountability", "fairness", "privacy",
+    "safety", "security", "human_value", "social_impact"
+))
+_N_DIMS = len(_DIMENSIONS)
+
+# Pre-bound to skip the double attribute lookup on the mutation hot path
+_dtnow = datetime.datetime.now
+
+# Write-ahead-log op -> the assessment list it appends to
+_WAL_LISTS = {
+    "add_evidence": "evidence",
+    "add_finding": "findings",
+    "add_risk": "risks",
+    "add_recommendation": "recommendations",
+}
+
+
+def _load_knowledge(specialization: str) -> Dict[str, Any]:
+    """Read and parse the knowledge base for a specialization"""
+    knowledge_path = os.path.join(KNOWLEDGE_BASE_PATH, f"{specialization}.json")
+    if os.path.exists(knowledge_path):
+        try:
+            with open(knowledge_path, 'rb') as f:
+                knowledge = loads(f.read())
+            logger.info("Loaded knowledge base for %s", specialization)
+            return knowledge
+        except Exception as e:
+            logger.error("Error loading knowledge for %s: %s", specialization, e)
+    else:
+        logger.warning("No knowledge base found for %s", specialization)
+    return {}
+
 class ValidationAgent:
     """Base class for all VerityAI validation agents"""
-    
+
+    __slots__ = ("agent_id", "specialization", "_knowledge",
+                 "assessment_results", "_dirty", "_wal", "logger")
+
     def __init__(self, agent_id: str, specialization: str):
         self.agent_id = agent_id
         self.specialization = specialization
-        self.knowledge = {}
+        self._knowledge = None
         self.assessment_results = {}
+        self._dirty = set()
+        self._wal = {}
         self.logger = logging.getLogger(f"VerityAI.{agent_id}")
-        self.load_knowledge()
-    
+
+    @property
+    def knowledge(self) -> Dict[str, Any]:
+        """Specialized knowledge for this agent, loaded on first access"""
+        if self._knowledge is None:
+            self.load_knowledge()
+        return self._knowledge
+
+    @knowledge.setter
+    def knowledge(self, value: Dict[str, Any]) -> None:
+        self._knowledge = value
+
     def load_knowledge(self) -> None:
         """Load specialized knowledge for this agent"""
-        knowledge_path = os.path.join(KNOWLEDGE_BASE_PATH, f"{self.specialization}.json")
-        if os.path.exists(knowledge_path):
-            try:
-                with open(knowledge_path, 'r') as f:
-                    self.knowledge = json.load(f)
-                self.logger.info(f"Loaded knowledge base for {self.specialization}")
-            except Exception as e:
-                self.logger.error(f"Error loading knowledge: {str(e)}")
-        else:
-            self.logger.warning(f"No knowledge base found for {self.specialization}")
+        self._knowledge = _load_knowledge(self.specialization)
     
     def create_assessment(self, system_id: str, metadata: Dict[str, Any]) -> str:
         """Initialize a new assessment"""
-        assessment_id = f"{system_id}_{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}"
-        
+        now = _dtnow()
+        ts_iso = now.isoformat()
+        assessment_id = f"{system_id}_{now.strftime('%Y%m%d%H%M%S')}"
+
         assessment = {
             "assessment_id": assessment_id,
             "system_id": system_id,
             "agent_id": self.agent_id,
             "specialization": self.specialization,
             "metadata": metadata,
-            "created_at": datetime.datetime.now().isoformat(),
-            "updated_at": datetime.datetime.now().isoformat(),
+            "created_at": ts_iso,
+            "updated_at": ts_iso,
             "status": "initialized",
             "evidence": [],
             "findings": [],
@@ -72,156 +113,249 @@ class ValidationAgent:
         }
         
         # Save initial assessment
-        assessment_path = os.path.join(ASSESSMENT_PATH, f"{assessment_id}.json")
-        with open(assessment_path, 'w') as f:
-            json.dump(assessment, f, indent=2)
-        
         self.assessment_results[assessment_id] = assessment
-        self.logger.info(f"Created assessment {assessment_id} for system {system_id}")
+        self._save_assessment(assessment_id)
+        self.logger.info("Created assessment %s for system %s", assessment_id, system_id)
         
         return assessment_id
     
     def add_evidence(self, assessment_id: str, evidence: Dict[str, Any]) -> None:
         """Add evidence to an assessment"""
-        if assessment_id not in self.assessment_results:
-            self._load_assessment(assessment_id)
-        
-        evidence["timestamp"] = datetime.datetime.now().isoformat()
-        self.assessment_results[assessment_id]["evidence"].append(evidence)
-        self.assessment_results[assessment_id]["updated_at"] = datetime.datetime.now().isoformat()
-        
-        # Save updated assessment
-        self._save_assessment(assessment_id)
-        self.logger.info(f"Added evidence to assessment {assessment_id}")
+        assessment = self._get(assessment_id)
+
+        now = _dtnow().isoformat()
+        evidence["timestamp"] = now
+        assessment["evidence"].append(evidence)
+        assessment["updated_at"] = now
+
+        self._dirty.add(assessment_id)
+        self._wal_append(assessment_id, "add_evidence", evidence)
+        self.logger.info("Added evidence to assessment %s", assessment_id)
     
     def add_finding(self, assessment_id: str, finding: Dict[str, Any]) -> None:
         """Add a finding to an assessment"""
-        if assessment_id not in self.assessment_results:
-            self._load_assessment(assessment_id)
-        
-        finding["timestamp"] = datetime.datetime.now().isoformat()
-        self.assessment_results[assessment_id]["findings"].append(finding)
-        self.assessment_results[assessment_id]["updated_at"] = datetime.datetime.now().isoformat()
-        
-        # Save updated assessment
-        self._save_assessment(assessment_id)
-        self.logger.info(f"Added finding to assessment {assessment_id}")
+        assessment = self._get(assessment_id)
+
+        now = _dtnow().isoformat()
+        finding["timestamp"] = now
+        assessment["findings"].append(finding)
+        assessment["updated_at"] = now
+
+        self._dirty.add(assessment_id)
+        self._wal_append(assessment_id, "add_finding", finding)
+        self.logger.info("Added finding to assessment %s", assessment_id)
     
     def add_risk(self, assessment_id: str, risk: Dict[str, Any]) -> None:
         """Add a risk to an assessment"""
-        if assessment_id not in self.assessment_results:
-            self._load_assessment(assessment_id)
-        
-        risk["timestamp"] = datetime.datetime.now().isoformat()
-        self.assessment_results[assessment_id]["risks"].append(risk)
-        self.assessment_results[assessment_id]["updated_at"] = datetime.datetime.now().isoformat()
-        
-        # Save updated assessment
-        self._save_assessment(assessment_id)
-        self.logger.info(f"Added risk to assessment {assessment_id}")
+        assessment = self._get(assessment_id)
+
+        now = _dtnow().isoformat()
+        risk["timestamp"] = now
+        assessment["risks"].append(risk)
+        assessment["updated_at"] = now
+
+        self._dirty.add(assessment_id)
+        self._wal_append(assessment_id, "add_risk", risk)
+        self.logger.info("Added risk to assessment %s", assessment_id)
     
     def add_recommendation(self, assessment_id: str, recommendation: Dict[str, Any]) -> None:
         """Add a recommendation to an assessment"""
-        if assessment_id not in self.assessment_results:
-            self._load_assessment(assessment_id)
-        
-        recommendation["timestamp"] = datetime.datetime.now().isoformat()
-        self.assessment_results[assessment_id]["recommendations"].append(recommendation)
-        self.assessment_results[assessment_id]["updated_at"] = datetime.datetime.now().isoformat()
-        
-        # Save updated assessment
-        self._save_assessment(assessment_id)
-        self.logger.info(f"Added recommendation to assessment {assessment_id}")
+        assessment = self._get(assessment_id)
+
+        now = _dtnow().isoformat()
+        recommendation["timestamp"] = now
+        assessment["recommendations"].append(recommendation)
+        assessment["updated_at"] = now
+
+        self._dirty.add(assessment_id)
+        self._wal_append(assessment_id, "add_recommendation", recommendation)
+        self.logger.info("Added recommendation to assessment %s", assessment_id)
     
+    @staticmethod
+    def _apply_score(assessment: Dict[str, Any], dimension: str, score: float,
+                     updated_at: str) -> None:
+        """Record one dimension score and refresh the overall score
+
+        Keeps a running count of scored dimensions in the assessment so the
+        all-dimensions-present check is O(1) per call instead of a set scan;
+        the count is rebuilt from the scores dict for snapshots predating it.
+        """
+        scores = assessment.setdefault("compliance_scores", {})
+        was_new = dimension not in scores
+        scores[dimension] = score
+        assessment["updated_at"] = updated_at
+
+        count = assessment.get("_dims_set_count")
+        if count is None:
+            count = len(_DIMENSIONS.intersection(scores))
+        elif was_new and dimension in _DIMENSIONS:
+            count += 1
+        assessment["_dims_set_count"] = count
+
+        # Calculate overall score if all dimensions are present
+        if count == _N_DIMS:
+            assessment["compliance_score"] = aggregate(scores[dim] for dim in _DIMENSIONS)
+
     def set_compliance_score(self, assessment_id: str, score: float, dimension: str) -> None:
         """Set compliance score for a specific dimension"""
-        if assessment_id not in self.assessment_results:
-            self._load_assessment(assessment_id)
-        
-        if "compliance_scores" not in self.assessment_results[assessment_id]:
-            self.assessment_results[assessment_id]["compliance_scores"] = {}
-        
-        self.assessment_results[assessment_id]["compliance_scores"][dimension] = score
-        self.assessment_results[assessment_id]["updated_at"] = datetime.datetime.now().isoformat()
-        
-        # Calculate overall score if all dimensions are present
-        dimensions = ["transparency", "accountability", "fairness", "privacy", 
-                     "safety", "security", "human_value", "social_impact"]
-        
-        scores = self.assessment_results[assessment_id]["compliance_scores"]
-        if all(dim in scores for dim in dimensions):
-            overall_score = sum(scores.values()) / len(dimensions)
-            self.assessment_results[assessment_id]["compliance_score"] = overall_score
-        
-        # Save updated assessment
-        self._save_assessment(assessment_id)
-        self.logger.info(f"Set compliance score for dimension {dimension} in assessment {assessment_id}")
+        assessment = self._get(assessment_id)
+        self._apply_score(assessment, dimension, score, _dtnow().isoformat())
+
+        self._dirty.add(assessment_id)
+        self._wal_append(assessment_id, "set_compliance_score",
+                         {"dimension": dimension, "score": score,
+                          "updated_at": assessment["updated_at"]})
+        self.logger.info("Set compliance score for dimension %s in assessment %s", dimension, assessment_id)
     
+    def flush(self) -> None:
+        """Write all buffered assessment mutations to disk"""
+        while self._dirty:
+            self._save_assessment(self._dirty.pop())
+
     def finalize_assessment(self, assessment_id: str) -> Dict[str, Any]:
         """Finalize an assessment and return the results"""
-        if assessment_id not in self.assessment_results:
-            self._load_assessment(assessment_id)
-        
-        self.assessment_results[assessment_id]["status"] = "completed"
-        self.assessment_results[assessment_id]["updated_at"] = datetime.datetime.now().isoformat()
-        self.assessment_results[assessment_id]["completed_at"] = datetime.datetime.now().isoformat()
-        
+        assessment = self._get(assessment_id)
+
+        now = _dtnow().isoformat()
+        assessment["status"] = "completed"
+        assessment["updated_at"] = now
+        assessment["completed_at"] = now
+
         # Save updated assessment
+        self._dirty.discard(assessment_id)
         self._save_assessment(assessment_id)
-        self.logger.info(f"Finalized assessment {assessment_id}")
-        
-        return self.assessment_results[assessment_id]
+        self.logger.info("Finalized assessment %s", assessment_id)
+
+        return assessment
     
+    def _get(self, assessment_id: str) -> Dict[str, Any]:
+        """Return an assessment, loading it from disk on a cache miss"""
+        assessment = self.assessment_results.get(assessment_id)
+        if assessment is None:
+            self._load_assessment(assessment_id)
+            assessment = self.assessment_results[assessment_id]
+        return assessment
+
+    def _wal_append(self, assessment_id: str, op: str, data: Dict[str, Any]) -> None:
+        """Durably append one mutation to the assessment's write-ahead log
+
+        A single flushed NDJSON line per mutation replaces the full-file
+        rewrite the old persistence model did, so mutation-heavy runs write
+        O(N) bytes instead of O(N^2). The log is compacted into the canonical
+        JSON snapshot by _save_assessment.
+        """
+        wal = self._wal.get(assessment_id)
+        if wal is None:
+            wal_path = os.path.join(ASSESSMENT_PATH, f"{assessment_id}.wal")
+            wal = open(wal_path, 'a')
+            self._wal[assessment_id] = wal
+        wal.write(dumps({"op": op, "data": data}) + "\n")
+        wal.flush()
+
+    def _replay_wal(self, assessment_id: str) -> None:
+        """Apply any uncompacted write-ahead-log records to a loaded snapshot"""
+        wal_path = os.path.join(ASSESSMENT_PATH, f"{assessment_id}.wal")
+        if not os.path.exists(wal_path):
+            return
+
+        assessment = self.assessment_results[assessment_id]
+        with open(wal_path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = loads(line)
+                op, data = record["op"], record["data"]
+                if op == "set_compliance_score":
+                    self._apply_score(assessment, data["dimension"], data["score"],
+                                      data["updated_at"])
+                else:
+                    assessment[_WAL_LISTS[op]].append(data)
+                    assessment["updated_at"] = data["timestamp"]
+
+        # The snapshot on disk is stale until the log is compacted into it
+        self._dirty.add(assessment_id)
+        self.logger.info("Replayed write-ahead log for assessment %s", assessment_id)
+
+    def _truncate_wal(self, assessment_id: str) -> None:
+        """Discard the write-ahead log once the snapshot covers it"""
+        wal = self._wal.pop(assessment_id, None)
+        if wal is not None:
+            wal.close()
+        wal_path = os.path.join(ASSESSMENT_PATH, f"{assessment_id}.wal")
+        if os.path.exists(wal_path):
+            os.remove(wal_path)
+
     def _load_assessment(self, assessment_id: str) -> None:
         """Load an assessment from disk"""
         assessment_path = os.path.join(ASSESSMENT_PATH, f"{assessment_id}.json")
         if os.path.exists(assessment_path):
             try:
                 with open(assessment_path, 'r') as f:
-                    self.assessment_results[assessment_id] = json.load(f)
-                self.logger.info(f"Loaded assessment {assessment_id}")
+                    self.assessment_results[assessment_id] = loads(f.read())
+                self._replay_wal(assessment_id)
+                self.logger.info("Loaded assessment %s", assessment_id)
             except Exception as e:
-                self.logger.error(f"Error loading assessment {assessment_id}: {str(e)}")
+                self.logger.error("Error loading assessment %s: %s", assessment_id, e)
                 raise ValueError(f"Could not load assessment {assessment_id}")
         else:
-            self.logger.error(f"Assessment {assessment_id} not found")
+            self.logger.error("Assessment %s not found", assessment_id)
             raise ValueError(f"Assessment {assessment_id} not found")
     
     def _save_assessment(self, assessment_id: str) -> None:
         """Save an assessment to disk"""
         assessment_path = os.path.join(ASSESSMENT_PATH, f"{assessment_id}.json")
         try:
-            with open(assessment_path, 'w') as f:
-                json.dump(self.assessment_results[assessment_id], f, indent=2)
-            self.logger.info(f"Saved assessment {assessment_id}")
+            # Write through a large buffer to a temp file, then rename into
+            # place so a crash mid-write can't leave a truncated assessment.
+            # The temp name includes the thread id because agents may save
+            # concurrently and assessment IDs are not unique per agent.
+            tmp_path = f"{assessment_path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', buffering=1 << 20) as f:
+                f.write(dumps(self.assessment_results[assessment_id]))
+            os.replace(tmp_path, assessment_path)
+            self._truncate_wal(assessment_id)
+            self.logger.info("Saved assessment %s", assessment_id)
         except Exception as e:
-            self.logger.error(f"Error saving assessment {assessment_id}: {str(e)}")
+            self.logger.error("Error saving assessment %s: %s", assessment_id, e)
             raise ValueError(f"Could not save assessment {assessment_id}")
 
 
 class AgentOrchestrator:
     """Coordinates multiple validation agents for comprehensive assessments"""
-    
+
+    __slots__ = ("agents", "assessments", "_knowledge_cache", "logger")
+
     def __init__(self):
         self.agents = {}
         self.assessments = {}
+        self._knowledge_cache = {}
         self.logger = logging.getLogger("VerityAI.Orchestrator")
-    
+
     def register_agent(self, agent: ValidationAgent) -> None:
-        """Register a validation agent with the orchestrator"""
+        """Register a validation agent with the orchestrator
+
+        Registered agents share one knowledge dict per specialization, loaded
+        at most once per orchestrator instead of once per agent.
+        """
+        if agent.specialization not in self._knowledge_cache:
+            self._knowledge_cache[agent.specialization] = _load_knowledge(agent.specialization)
+        agent.knowledge = self._knowledge_cache[agent.specialization]
         self.agents[agent.agent_id] = agent
-        self.logger.info(f"Registered agent {agent.agent_id} specializing in {agent.specialization}")
+        self.logger.info("Registered agent %s specializing in %s", agent.agent_id, agent.specialization)
     
     def create_comprehensive_assessment(self, system_id: str, metadata: Dict[str, Any]) -> str:
         """Create a comprehensive assessment using all registered agents"""
-        orchestration_id = f"orch_{system_id}_{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}"
-        
+        now = _dtnow()
+        ts_iso = now.isoformat()
+        orchestration_id = f"orch_{system_id}_{now.strftime('%Y%m%d%H%M%S')}"
+
         orchestration = {
             "orchestration_id": orchestration_id,
             "system_id": system_id,
             "metadata": metadata,
-            "created_at": datetime.datetime.now().isoformat(),
-            "updated_at": datetime.datetime.now().isoformat(),
+            "created_at": ts_iso,
+            "updated_at": ts_iso,
             "status": "initialized",
             "agent_assessments": {},
             "integrated_findings": [],
@@ -231,95 +365,122 @@ class AgentOrchestrator:
             "overall_compliance_score": None
         }
         
-        # Create individual assessments with each agent
-        for agent_id, agent in self.agents.items():
-            assessment_id = agent.create_assessment(system_id, metadata)
-            orchestration["agent_assessments"][agent_id] = {
-                "assessment_id": assessment_id,
-                "specialization": agent.specialization,
-                "status": "initialized"
-            }
+        # Create individual assessments with each agent. Each agent writes an
+        # independent file, so the I/O-bound creation calls are dispatched
+        # concurrently instead of paying each disk round-trip in sequence.
+        if self.agents:
+            assessments_lock = threading.Lock()
+            with ThreadPoolExecutor(max_workers=len(self.agents)) as executor:
+                futures = {
+                    executor.submit(agent.create_assessment, system_id, metadata): agent
+                    for agent in self.agents.values()
+                }
+                for future in as_completed(futures):
+                    agent = futures[future]
+                    assessment_id = future.result()
+                    with assessments_lock:
+                        orchestration["agent_assessments"][agent.agent_id] = {
+                            "assessment_id": assessment_id,
+                            "specialization": agent.specialization,
+                            "status": "initialized"
+                        }
         
         # Save orchestration
         self.assessments[orchestration_id] = orchestration
         orchestration_path = os.path.join(ASSESSMENT_PATH, f"{orchestration_id}.json")
-        with open(orchestration_path, 'w') as f:
-            json.dump(orchestration, f, indent=2)
+        tmp_path = f"{orchestration_path}.tmp"
+        with open(tmp_path, 'w', buffering=1 << 20) as f:
+            f.write(dumps(orchestration, indent=True))
+        os.replace(tmp_path, orchestration_path)
         
-        self.logger.info(f"Created comprehensive assessment {orchestration_id} for system {system_id}")
+        self.logger.info("Created comprehensive assessment %s for system %s", orchestration_id, system_id)
         
         return orchestration_id
     
-    def generate_report(self, orchestration_id: str, report_format: str = "json") -> str:
-        """Generate a formatted report from assessment results"""
+    def generate_report(self, orchestration_id: str, report_format: str = "json",
+                        out: Optional[Any] = None) -> Optional[str]:
+        """Generate a formatted report from assessment results
+
+        When `out` (a writable text file) is provided, the report is streamed
+        directly to it and None is returned, keeping peak memory flat instead
+        of materializing the full report as a string first.
+        """
         if orchestration_id not in self.assessments:
             self._load_orchestration(orchestration_id)
-        
+
         orchestration = self.assessments[orchestration_id]
-        
+
         if report_format == "json":
-            # Return the full orchestration as JSON
-            return json.dumps(orchestration, indent=2)
+            # Write or return the full orchestration as JSON
+            if out is not None:
+                dump(orchestration, out, indent=True)
+                return None
+            return dumps(orchestration, indent=True)
         elif report_format == "markdown":
             # Generate a markdown report
-            return self._generate_markdown_report(orchestration)
+            return self._generate_markdown_report(orchestration, out)
         else:
             raise ValueError(f"Unsupported report format: {report_format}")
+
+    def write_report(self, orchestration_id: str, path: str,
+                     report_format: str = "json") -> None:
+        """Generate a report and stream it straight to a file
+
+        Fuses report generation and the file write so no intermediate report
+        string is ever materialized.
+        """
+        with open(path, 'w', buffering=1 << 20) as f:
+            self.generate_report(orchestration_id, report_format, out=f)
+        self.logger.info("Wrote %s report for %s to %s", report_format, orchestration_id, path)
     
-    def _generate_markdown_report(self, orchestration: Dict[str, Any]) -> str:
-        """Generate a markdown report from orchestration results"""
+    def _generate_markdown_report(self, orchestration: Dict[str, Any],
+                                  out: Optional[Any] = None) -> Optional[str]:
+        """Generate a markdown report from orchestration results
+
+        Streams lines to `out` when provided; otherwise returns the report
+        as a string.
+        """
         system_id = orchestration["system_id"]
-        report = []
-        
-        # Title
-        report.append(f"# AI System Compliance Assessment: {system_id}")
-        report.append(f"*Generated by VerityAI on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
-        report.append("")
-        
-        # Executive Summary
-        report.append("## Executive Summary")
-        report.append("")
-        
+        buf = out if out is not None else io.StringIO()
+        w = buf.write
+
+        # Title and Executive Summary
+        w(f"# AI System Compliance Assessment: {system_id}\n"
+          f"*Generated by VerityAI on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n"
+          "\n"
+          "## Executive Summary\n"
+          "\n")
+
         if "overall_compliance_score" in orchestration and orchestration["overall_compliance_score"] is not None:
             score = orchestration["overall_compliance_score"]
-            report.append(f"**Overall Compliance Score:** {score:.2f}/5.0")
-            
-            # Simple rating
-            if score >= 4.5:
-                rating = "Excellent"
-            elif score >= 4.0:
-                rating = "Very Good"
-            elif score >= 3.5:
-                rating = "Good"
-            elif score >= 3.0:
-                rating = "Satisfactory"
-            elif score >= 2.0:
-                rating = "Needs Improvement"
-            else:
-                rating = "Significant Concerns"
-            
-            report.append(f"**Rating:** {rating}")
-        
-        report.append("")
-        
+
+            # Simple rating from the banded table
+            rating = RATING_BANDS[rate(score)][1]
+
+            w(f"**Overall Compliance Score:** {score:.2f}/5.0\n"
+              f"**Rating:** {rating}\n")
+
         # Assessment Metadata
-        report.append("## Assessment Information")
-        report.append("")
-        report.append(f"**Assessment ID:** {orchestration['orchestration_id']}")
-        report.append(f"**System ID:** {orchestration['system_id']}")
-        report.append(f"**Date Completed:** {orchestration.get('completed_at', 'N/A')}")
-        report.append(f"**Conducted By:** VerityAI Assessment Platform")
-        report.append("")
-        
+        w("\n"
+          "## Assessment Information\n"
+          "\n"
+          f"**Assessment ID:** {orchestration['orchestration_id']}\n"
+          f"**System ID:** {orchestration['system_id']}\n"
+          f"**Date Completed:** {orchestration.get('completed_at', 'N/A')}\n"
+          "**Conducted By:** VerityAI Assessment Platform\n")
+
         # About VerityAI
-        report.append("---")
-        report.append("## About VerityAI")
-        report.append("")
-        report.append("VerityAI provides independent AI validation services to help organizations ensure their AI systems are compliant with regulatory requirements, industry standards, and ethical guidelines.")
-        report.append("")
-        report.append("For more information, visit [verityai.co](https://verityai.co).")
-        
-        return "\n".join(report)
+        w("\n"
+          "---\n"
+          "## About VerityAI\n"
+          "\n"
+          "VerityAI provides independent AI validation services to help organizations ensure their AI systems are compliant with regulatory requirements, industry standards, and ethical guidelines.\n"
+          "\n"
+          "For more information, visit [verityai.co](https://verityai.co).")
+
+        if out is not None:
+            return None
+        return buf.getvalue()
     
     def _load_orchestration(self, orchestration_id: str) -> None:
         """Load an orchestration from disk"""
@@ -327,11 +488,11 @@ class AgentOrchestrator:
         if os.path.exists(orchestration_path):
             try:
                 with open(orchestration_path, 'r') as f:
-                    self.assessments[orchestration_id] = json.load(f)
-                self.logger.info(f"Loaded orchestration {orchestration_id}")
+                    self.assessments[orchestration_id] = loads(f.read())
+                self.logger.info("Loaded orchestration %s", orchestration_id)
             except Exception as e:
-                self.logger.error(f"Error loading orchestration {orchestration_id}: {str(e)}")
+                self.logger.error("Error loading orchestration %s: %s", orchestration_id, e)
                 raise ValueError(f"Could not load orchestration {orchestration_id}")
         else:
-            self.logger.error(f"Orchestration {orchestration_id} not found")
+            self.logger.error("Orchestration %s not found", orchestration_id)
             raise ValueError(f"Orchestration {orchestration_id} not found")
@@ -0,0 +1,9 @@
+# /core/warmup.py
+# [Version 30-08-2026 15:28:34]
+
+"""Warm the optional JIT-compiled helpers: python -m core.warmup"""
+
+from ._fastmath import warmup
+
+if __name__ == "__main__":
+    warmup()